@@ -1,13 +1,16 @@
 #!/usr/bin/env python
 
 from collections import namedtuple
-from datetime import datetime as dt
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import date, datetime as dt
+from functools import cache, lru_cache
 from zoneinfo import ZoneInfo
 
-import pint
-import requests
-from suntime import Sun
-import zipcodes
+try:  # optional, faster decoding of the large forecast payloads
+    import orjson as json
+except ImportError:
+    import json
 
 
 UNIT_NT = namedtuple("unit", "base SI US")
@@ -21,15 +24,142 @@ UNIT_MAP = {
     "degree_(angle)": ("degree", "degree", "degree"),
 }
 UNIT_NTS = {k: UNIT_NT(*v) for k, v in UNIT_MAP.items()}
-UREG = pint.UnitRegistry()
-UREG.define("percent = 1e-2 frac = %")
-pint.Quantity.__format__ = lambda a, _: f"{a.magnitude:0.1f}{a.units:~}"
+
+
+# pint, httpx, suntime and zipcodes are imported where first needed:
+# building the unit registry alone dominates the module's import time
+@cache
+def _get_ureg():
+    import pint
+
+    ureg = pint.UnitRegistry()
+    ureg.define("percent = 1e-2 frac = %")
+    return ureg
+
+
+def fmt_q(q, spec: str = "0.1f"):
+    """
+    format a Measure as magnitude immediately followed by its unit label
+    """
+    if q is None:  # missing observation value
+        return f"{q}"
+    return f"{q.magnitude:{spec}}{q.units}"
+
+
+class Measure(namedtuple("measure", "magnitude units")):
+    """
+    value already converted to display units
+    """
+
+    __slots__ = ()
+
+    def __format__(self, spec):
+        return fmt_q(self, spec or "0.1f")
+
+
+@dataclass(slots=True, frozen=True)
+class Period:
+    """
+    one hourly forecast period
+    """
+
+    start_time: dt
+    end_time: dt
+    is_daytime: bool
+    desc: str
+    temperature: Measure
+    wind_direction: str
+    wind_speed: Measure
+
+
+@dataclass(slots=True, frozen=True)
+class Forecast:
+    """
+    hourly forecast kept column-wise (one tuple per field, magnitudes in
+    the *_units labels); Period rows are only built on demand
+    """
+
+    elevation: Measure
+    generated_at: dt
+    updated_at: dt
+    immediate: str
+    start_times: tuple
+    end_times: tuple
+    is_daytime: tuple
+    descs: tuple
+    temperatures: tuple
+    wind_directions: tuple
+    wind_speeds: tuple
+    temperature_units: str
+    wind_speed_units: str
+
+    @property
+    def periods(self):
+        rows = zip(
+            self.start_times,
+            self.end_times,
+            self.is_daytime,
+            self.descs,
+            self.temperatures,
+            self.wind_directions,
+            self.wind_speeds,
+        )
+        tu, wu = self.temperature_units, self.wind_speed_units
+        return [
+            Period(
+                start, end, day, desc, Measure(t, tu), wind_dir, Measure(w, wu)
+            )
+            for start, end, day, desc, t, wind_dir, w in rows
+        ]
+
+
+def _conversion(base: str, target: str):
+    # every mapped unit converts affinely: target = base * scale + offset
+    ureg = _get_ureg()
+    zero, one = (ureg.Quantity(v, base).to(target) for v in (0, 1))
+    return one.magnitude - zero.magnitude, zero.magnitude, f"{one.units:~}"
+
+
+@cache
+def _unit_conversions():
+    """
+    (unit code, unit system) -> (scale, offset, unit label)
+    """
+    return {
+        (code, system): _conversion(unit.base, getattr(unit, system))
+        for code, unit in UNIT_NTS.items()
+        for system in ("SI", "US")
+    }
+
+
+@cache
+def _nt_class(name: str, fields: tuple):
+    # synthesizing a namedtuple class is far costlier than instantiating one
+    return namedtuple(name, fields)
 
 
 def dict_to_nt(name: str, dct: dict):
     items = dct.get("properties", dct).items()
     _dct = {k.removeprefix("@"): v for k, v in items}
-    return namedtuple(name, _dct.keys())(**_dct)
+    return _nt_class(name, tuple(_dct))(**_dct)
+
+
+@lru_cache(maxsize=256)
+def _suntime_cached(lat: float, lng: float, day: date):
+    # suntime computes for the local "today"; `day` expires entries daily
+    from suntime import Sun
+
+    sun = Sun(lat, lng)
+    return sun.get_local_sunrise_time(), sun.get_local_sunset_time()
+
+
+@lru_cache(maxsize=512)
+def _area_info_cached(zipcode: str):
+    # zipcodes.matching scans the whole bundled dataset on every call
+    import zipcodes
+
+    area_data = zipcodes.matching(zipcode)[0]
+    return dict_to_nt("area", area_data)
 
 
 class Weather:
@@ -39,6 +169,28 @@ class Weather:
     """
 
     WEATHER_BASE_URL = "https://api.weather.gov"
+    _client = None  # shared HTTP/2 client, created on first request
+    # QuantitativeValue fields of an observation, in NWS schema order
+    _OBS_FIELDS = (
+        "elevation",
+        "temperature",
+        "dewpoint",
+        "windDirection",
+        "windSpeed",
+        "windGust",
+        "barometricPressure",
+        "seaLevelPressure",
+        "visibility",
+        "maxTemperatureLast24Hours",
+        "minTemperatureLast24Hours",
+        "precipitationLastHour",
+        "precipitationLast3Hours",
+        "precipitationLast6Hours",
+        "relativeHumidity",
+        "windChill",
+        "heatIndex",
+    )
+    _SERIALIZE_EXCLUDED = frozenset({"elevation", "cloud_layers"})
 
     def __init__(self, area, units="F"):
         self.area = area
@@ -55,8 +207,7 @@ class Weather:
 
     @staticmethod
     def area_info(zipcode):
-        area_data = zipcodes.matching(f"{zipcode}")[0]
-        return dict_to_nt("area", area_data)
+        return _area_info_cached(str(zipcode))
 
     @classmethod
     def from_zipcode(cls, zipcode: [str, int], units: [str, None] = "F"):
@@ -75,27 +226,46 @@ class Weather:
     def wtr_get(cls, route: str, params: dict = None, key="properties"):
         route = route.removeprefix(cls.WEATHER_BASE_URL).removeprefix("/")
         url = f"{cls.WEATHER_BASE_URL}/{route}"
-        resp = requests.get(url, params=params)
+        if cls._client is None:
+            import httpx
+
+            # one HTTP/2 connection multiplexes the concurrent fetches
+            limits = httpx.Limits(
+                max_connections=10, max_keepalive_connections=5
+            )
+            transport = httpx.HTTPTransport(
+                http2=True, limits=limits, retries=2
+            )
+            # requests followed redirects by default, httpx does not
+            cls._client = httpx.Client(
+                transport=transport, timeout=10.0, follow_redirects=True
+            )
+        resp = cls._client.get(url, params=params)
         if resp.status_code == 200:
-            data = resp.json()
+            data = json.loads(resp.content)
             return data if key is None else data[key]
         raise Exception(f"API error: {url=}, {params=}")
 
     def _local_time(self, timestamp):
         return dt.fromisoformat(timestamp).astimezone(self.tz)
 
+    def _local_times(self, timestamps):
+        """
+        {timestamp: local datetime}, converting each distinct stamp once
+        """
+        tz = self.tz
+        return {t: dt.fromisoformat(t).astimezone(tz) for t in set(timestamps)}
+
     def _to_units(self, v):
         if (val := v["value"]) is None:
             return val
-        unit = UNIT_NTS[v["unitCode"].removeprefix("unit:")]
-        quant = UREG.Quantity(val, UREG(unit.base))
-        return quant.to(getattr(unit, self.units))
+        code = v["unitCode"].removeprefix("unit:")
+        scale, offset, units = _unit_conversions()[code, self.units]
+        return Measure(val * scale + offset, units)
 
     def _process_current(self, data):
         obs = {
-            k: self._to_units(v)
-            for k, v in data.items()
-            if isinstance(v, dict)
+            k: self._to_units(data[k]) for k in self._OBS_FIELDS if data.get(k)
         }
         obs["desc"] = data["textDescription"]
         obs["timestamp"] = self._local_time(data["timestamp"])
@@ -107,39 +277,41 @@ class Weather:
         obs["data"] = self._serialize(obs)
         return obs
 
-    @staticmethod
-    def _serialize(data):
-        EXCLUDED_FIELDS = ["elevation", "cloud_layers"]
+    @classmethod
+    def _serialize(cls, data):
         sdct = {}
         for k, v in data.items():
-            if k in EXCLUDED_FIELDS or v is None:
+            if k in cls._SERIALIZE_EXCLUDED or v is None:
                 continue
-            sdct[k] = round(v.magnitude,2) if isinstance(v, pint.Quantity) else v
+            sdct[k] = round(v.magnitude,2) if isinstance(v, Measure) else v
         return sdct
 
     def _process_forecast(self, data):
-        def _period(per):
-            wind_speed = UREG.Quantity(per["windSpeed"].replace("/h", "/hour"))
-            unit = UNIT_NTS[f"{wind_speed.units}"]
-            wind_speed = wind_speed.to(getattr(unit, self.units))
-            temperature = UREG.Quantity(per["temperature"], "degree_Celsius")
-            temperature = temperature.to(getattr(UNIT_NTS["degC"], self.units))
-            pdct = {
-                "start_time": self._local_time(per["startTime"]),
-                "end_time": self._local_time(per["endTime"]),
-                "is_daytime": per["isDaytime"],
-                "desc": per["shortForecast"],
-                "temperature": temperature,
-                "wind_direction": per["windDirection"],
-                "wind_speed": wind_speed,
-            }
-            return dict_to_nt("period", pdct)
+        # periods already come in self.units: degC/degF, "<n> km/h"/"<n> mph"
+        conv = _unit_conversions()
+        t_units = conv["degC", self.units][2]
+        w_units = conv["kilometer / hour", self.units][2]
+        periods = data["periods"]
+        # "<n> mph" or "<n> to <m> mph": the leading integer is the speed
+        speeds = [int(p["windSpeed"].partition(" ")[0]) for p in periods]
+
+        # an hourly period ends where the next starts: ~half the stamps repeat
+        stamps = [p[k] for p in periods for k in ("startTime", "endTime")]
+        local_times = self._local_times(stamps)
 
         obs = {
             "elevation": self._to_units(data["elevation"]),
             "generated_at": self._local_time(data["generatedAt"]),
             "updated_at": self._local_time(data["updateTime"]),
-            "periods": [_period(p) for p in data["periods"]],
+            "start_times": tuple(local_times[p["startTime"]] for p in periods),
+            "end_times": tuple(local_times[p["endTime"]] for p in periods),
+            "is_daytime": tuple(p["isDaytime"] for p in periods),
+            "descs": tuple(p["shortForecast"] for p in periods),
+            "temperatures": tuple(p["temperature"] for p in periods),
+            "wind_directions": tuple(p["windDirection"] for p in periods),
+            "wind_speeds": tuple(speeds),
+            "temperature_units": t_units,
+            "wind_speed_units": w_units,
         }
         return obs
 
@@ -147,37 +319,48 @@ class Weather:
         route = f"/points/{','.join(self.coords)}"
         resp = self.wtr_get(route)
         self.meta = dict_to_nt("meta", resp)
-        resp = self.wtr_get(self.meta.forecastHourly, params={"units": "si"})
         params = {"units": self.units.lower()}
-        imd = self.wtr_get(self.meta.forecast, params=params)["periods"][0]
-        idct = {"immediate": f"{imd['name']}: {imd['detailedForecast']}"}
-        forecast_data = self._process_forecast(resp)
-        self.forecast = dict_to_nt("forecast", forecast_data | idct)
-        resp = self.wtr_get(self.meta.observationStations, key="features")[0]
-        self.station = dict_to_nt("station", resp)
-        latest_url = f"{self.station.id}/observations/latest"
-        resp = self.wtr_get(latest_url)
-        current = self._process_current(resp)
-        self.current = dict_to_nt("current", current)
+        # everything past /points only depends on meta: fan out on threads
+        # sharing one HTTP/2 client, keep the JSON processing on this one
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            hourly = pool.submit(
+                self.wtr_get, self.meta.forecastHourly, params=params
+            )
+            daily = pool.submit(
+                self.wtr_get, self.meta.forecast, params=params
+            )
+            stations = pool.submit(
+                self.wtr_get, self.meta.observationStations, key="features"
+            )
+            self.station = dict_to_nt("station", stations.result()[0])
+            latest_url = f"{self.station.id}/observations/latest"
+            latest = pool.submit(self.wtr_get, latest_url)
+            imd = daily.result()["periods"][0]
+            idct = {"immediate": f"{imd['name']}: {imd['detailedForecast']}"}
+            forecast_data = self._process_forecast(hourly.result())
+            self.forecast = Forecast(**forecast_data, **idct)
+            current = self._process_current(latest.result())
+            self.current = dict_to_nt("current", current)
 
     def calc_suntime(self):
-        sun = Sun(float(self.area.lat), float(self.area.long))
-        sdct = {
-            w: getattr(sun, f"get_local_{w}_time")().astimezone(self.tz)
-            for w in ["sunrise", "sunset"]
-        }
+        lat, lng = float(self.area.lat), float(self.area.long)
+        times = _suntime_cached(lat, lng, date.today())
+        events = zip(("sunrise", "sunset"), times)
+        sdct = {w: t.astimezone(self.tz) for w, t in events}
         self.suntime = dict_to_nt("suntime", sdct)
 
     def text_report(self, forecast_periods: int = 24):
-        ftemps = self.forecast.periods[:forecast_periods]
-        hi_lo = [f([p.temperature for p in ftemps]) for f in [min, max]]
+        ftemps = self.forecast.temperatures[:forecast_periods]
+        units = self.forecast.temperature_units
+        hi_lo = [Measure(f(ftemps), units) for f in [min, max]]
         msg = [
             f"Weather for {self.area.city} ({self.area.zip_code}) - "
             f"{self.timestamp.strftime('%a %I:%M%p').replace(' 0', ' ')}",
-            f"Now: {self.current.temperature}, {self.current.desc.lower()}, "
-            f"next 24h: {hi_lo[0]} to {hi_lo[1]}",
-            f"Humidity: {self.current.relativeHumidity}, "
-            f"visibility: {self.current.visibility}",
+            f"Now: {fmt_q(self.current.temperature)}, "
+            f"{self.current.desc.lower()}, "
+            f"next 24h: {fmt_q(hi_lo[0])} to {fmt_q(hi_lo[1])}",
+            f"Humidity: {fmt_q(self.current.relativeHumidity)}, "
+            f"visibility: {fmt_q(self.current.visibility)}",
             f"Daytime {self.suntime.sunrise.strftime('%_I:%M%p').strip()} to "
             f"{self.suntime.sunset.strftime('%_I:%M%p').strip()}",
             self.forecast.immediate,
@@ -1,6 +1,6 @@
 #!/usr/bin/env python
 
-from pprint import pprint as pp
+import json
 
 from weather import Weather
 
@@ -15,4 +15,4 @@ if __name__ == "__main__":  # Local Testing
     zipcode = "10001"
     units = "m"  # "F"/"US" or "m"/"SI"
     resp = main(zipcode=zipcode, units=units)
-    pp(resp)
+    print(json.dumps(resp, indent=2, default=str, ensure_ascii=False))